@@ -32,6 +32,7 @@
 """
 from __future__ import division
 
+import logging
 from io import StringIO
 
 from pyomo.common.config import (
@@ -51,6 +52,48 @@ from pyomo.opt.base import SolverFactory
 
 __version__ = (20, 2, 28)  # Note: date-based version number
 
+_implementation_citation = """
+If you use this software, you may cite the following:
+- Implementation:
+Chen, Q; Johnson, ES; Bernal, DE; Valentin, R; Kale, S;
+Bates, J; Siirola, JD; Grossmann, IE.
+Pyomo.GDP: an ecosystem for logic based modeling and optimization development.
+Optimization and Engineering, 2021.
+""".strip()
+
+_strategy_citations = {
+    'LOA': """
+- LOA algorithm:
+Türkay, M; Grossmann, IE.
+Logic-based MINLP algorithms for the optimal synthesis of process networks.
+Comp. and Chem. Eng. 1996, 20(8), 959–978.
+DOI: 10.1016/0098-1354(95)00219-7.
+    """.strip(),
+    'GLOA': """
+- GLOA algorithm:
+Lee, S; Grossmann, IE.
+A Global Optimization Algorithm for Nonconvex Generalized Disjunctive
+Programming and Applications to Process Systems.
+Comp. and Chem. Eng. 2001, 25, 1675-1697.
+DOI: 10.1016/S0098-1354(01)00732-3.
+    """.strip(),
+    'LBB': """
+- LBB algorithm:
+Lee, S; Grossmann, IE.
+New algorithms for nonlinear generalized disjunctive programming.
+Comp. and Chem. Eng. 2000, 24, 2125-2141.
+DOI: 10.1016/S0098-1354(00)00581-0.
+    """.strip(),
+}
+
+
+def _get_solver_args_text(solver_args):
+    """Format a subsolver arguments block for the solver intro message."""
+    args_output = StringIO()
+    solver_args.display(ostream=args_output)
+    args_text = indent(args_output.getvalue().rstrip(), prefix=" " * 2 + " - ")
+    return "" if len(args_text.strip()) == 0 else "\n" + args_text
+
 
 @SolverFactory.register(
     'gdpopt',
@@ -89,7 +132,9 @@ class GDPoptSolver(object):
 
     """
 
-    # Declare configuration options for the GDPopt solver
+    # Declare configuration options for the GDPopt solver. Note that this
+    # cannot be deferred to first use: the solve() docstring is generated
+    # from CONFIG when this module is imported (see the end of this file).
     CONFIG = _get_GDPopt_config()
 
     def solve(self, model, **kwds):
@@ -169,34 +214,12 @@ class GDPoptSolver(object):
         return __version__
 
     def _log_solver_intro_message(self, config):
+        if not config.logger.isEnabledFor(logging.INFO):
+            return
         config.logger.info(
             "Starting GDPopt version %s using %s algorithm"
             % (".".join(map(str, self.version())), config.strategy)
         )
-        mip_args_output = StringIO()
-        nlp_args_output = StringIO()
-        minlp_args_output = StringIO()
-        lminlp_args_output = StringIO()
-        config.mip_solver_args.display(ostream=mip_args_output)
-        config.nlp_solver_args.display(ostream=nlp_args_output)
-        config.minlp_solver_args.display(ostream=minlp_args_output)
-        config.local_minlp_solver_args.display(ostream=lminlp_args_output)
-        mip_args_text = indent(mip_args_output.getvalue().rstrip(), prefix=" " *
-                               2 + " - ")
-        nlp_args_text = indent(nlp_args_output.getvalue().rstrip(), prefix=" " *
-                               2 + " - ")
-        minlp_args_text = indent(minlp_args_output.getvalue().rstrip(),
-                                 prefix=" " * 2 + " - ")
-        lminlp_args_text = indent(lminlp_args_output.getvalue().rstrip(),
-                                  prefix=" " * 2 + " - ")
-        mip_args_text = "" if len(mip_args_text.strip()) == 0 else \
-                        "\n" + mip_args_text
-        nlp_args_text = "" if len(nlp_args_text.strip()) == 0 else \
-                        "\n" + nlp_args_text
-        minlp_args_text = "" if len(minlp_args_text.strip()) == 0 else \
-                          "\n" + minlp_args_text
-        lminlp_args_text = "" if len(lminlp_args_text.strip()) == 0 else \
-                           "\n" + lminlp_args_text
         config.logger.info(
             """
 Subsolvers:
@@ -206,51 +229,20 @@ Subsolvers:
 - local MINLP: {lminlp}{lminlp_args}
             """.format(
                 milp=config.mip_solver,
-                milp_args=mip_args_text,
+                milp_args=_get_solver_args_text(config.mip_solver_args),
                 nlp=config.nlp_solver,
-                nlp_args=nlp_args_text,
+                nlp_args=_get_solver_args_text(config.nlp_solver_args),
                 minlp=config.minlp_solver,
-                minlp_args=minlp_args_text,
+                minlp_args=_get_solver_args_text(config.minlp_solver_args),
                 lminlp=config.local_minlp_solver,
-                lminlp_args=lminlp_args_text,
+                lminlp_args=_get_solver_args_text(
+                    config.local_minlp_solver_args),
             ).strip()
         )
-        to_cite_text = """
-If you use this software, you may cite the following:
-- Implementation:
-Chen, Q; Johnson, ES; Bernal, DE; Valentin, R; Kale, S;
-Bates, J; Siirola, JD; Grossmann, IE.
-Pyomo.GDP: an ecosystem for logic based modeling and optimization development.
-Optimization and Engineering, 2021. 
-        """.strip()
-        if config.strategy == "LOA":
-            to_cite_text += "\n"
-            to_cite_text += """
-- LOA algorithm:
-Türkay, M; Grossmann, IE.
-Logic-based MINLP algorithms for the optimal synthesis of process networks.
-Comp. and Chem. Eng. 1996, 20(8), 959–978.
-DOI: 10.1016/0098-1354(95)00219-7.
-            """.strip()
-        elif config.strategy == "GLOA":
-            to_cite_text += "\n"
-            to_cite_text += """
-- GLOA algorithm:
-Lee, S; Grossmann, IE.
-A Global Optimization Algorithm for Nonconvex Generalized Disjunctive
-Programming and Applications to Process Systems.
-Comp. and Chem. Eng. 2001, 25, 1675-1697.
-DOI: 10.1016/S0098-1354(01)00732-3.
-            """.strip()
-        elif config.strategy == "LBB":
-            to_cite_text += "\n"
-            to_cite_text += """
-- LBB algorithm:
-Lee, S; Grossmann, IE.
-New algorithms for nonlinear generalized disjunctive programming.
-Comp. and Chem. Eng. 2000, 24, 2125-2141.
-DOI: 10.1016/S0098-1354(00)00581-0.
-            """.strip()
+        to_cite_text = _implementation_citation
+        strategy_citation = _strategy_citations.get(config.strategy)
+        if strategy_citation is not None:
+            to_cite_text += "\n" + strategy_citation
         config.logger.info(to_cite_text)
 
     _metasolver = False
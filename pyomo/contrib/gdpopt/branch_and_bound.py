@@ -19,7 +19,7 @@ from pyomo.contrib.fbbt.fbbt import fbbt
 from pyomo.contrib.gdpopt.util import (
     copy_var_list_values, SuppressInfeasibleWarning, get_main_elapsed_time)
 from pyomo.contrib.satsolver.satsolver import satisfiable
-from pyomo.core import minimize, Suffix, Constraint, TransformationFactory
+from pyomo.core import Suffix, Constraint, TransformationFactory
 from pyomo.opt import SolverFactory, SolverStatus
 from pyomo.opt import TerminationCondition as tc
 
@@ -151,10 +151,10 @@ def _perform_branch_and_bound(solve_data):
                 .format(config.time_limit, elapsed))
             no_feasible_soln = float('inf')
             solve_data.LB = node_data.obj_lb if \
-                            solve_data.objective_sense == minimize else \
+                            solve_data.objective_is_minimize else \
                             -no_feasible_soln
             solve_data.UB = no_feasible_soln if \
-                            solve_data.objective_sense == minimize else \
+                            solve_data.objective_is_minimize else \
                             -node_data.obj_lb
             config.logger.info(
                 'Final bound values: LB: {}  UB: {}'.
@@ -189,10 +189,10 @@ def _perform_branch_and_bound(solve_data):
             )
 
             solve_data.LB = node_data.obj_lb if \
-                            solve_data.objective_sense == minimize else \
+                            solve_data.objective_is_minimize else \
                             -node_data.obj_ub
             solve_data.UB = node_data.obj_ub if \
-                            solve_data.objective_sense == minimize else \
+                            solve_data.objective_is_minimize else \
                             -node_data.obj_lb
             solve_data.master_iteration = solve_data.explored_nodes
             if node_data.obj_lb == float('inf'):
@@ -322,7 +322,7 @@ def _evaluate_node(node_data, node_model, solve_data):
 def _solve_rnGDP_subproblem(model, solve_data):
     config = solve_data.config
     subproblem = TransformationFactory('gdp.bigm').create_using(model)
-    obj_sense_correction = solve_data.objective_sense != minimize
+    obj_sense_correction = not solve_data.objective_is_minimize
 
     try:
         with SuppressInfeasibleWarning():
@@ -410,7 +410,7 @@ def _solve_local_rnGDP_subproblem(model, solve_data):
     # TODO for now, return (LB, UB) = (-inf, inf) (for minimize)
     config = solve_data.config
     subproblem = TransformationFactory('gdp.bigm').create_using(model)
-    obj_sense_correction = solve_data.objective_sense != minimize
+    obj_sense_correction = not solve_data.objective_is_minimize
 
     try:
         with SuppressInfeasibleWarning():
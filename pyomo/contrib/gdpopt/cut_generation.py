@@ -19,7 +19,7 @@ from pyomo.contrib.gdp_bounds.info import disjunctive_bounds
 from pyomo.contrib.gdpopt.util import time_code, constraints_in_True_disjuncts
 from pyomo.contrib.mcpp.pyomo_mcpp import McCormick as mc, MCPP_Error
 from pyomo.core import (Block, ConstraintList, NonNegativeReals, VarList,
-                        minimize, value, TransformationFactory)
+                        value, TransformationFactory)
 from pyomo.core.expr import differentiate
 from pyomo.core.expr.visitor import identify_variables
 
@@ -41,7 +41,7 @@ def add_outer_approximation_cuts(nlp_result, solve_data, config):
     with time_code(solve_data.timing, 'OA cut generation'):
         m = solve_data.linear_GDP
         GDPopt = m.GDPopt_utils
-        sign_adjust = -1 if solve_data.objective_sense == minimize else 1
+        sign_adjust = -1 if solve_data.objective_is_minimize else 1
 
         # copy values over
         for var, val in zip(GDPopt.variable_list, nlp_result.var_values):
@@ -218,8 +218,7 @@ def add_integer_cut(var_values, target_model, solve_data, config,
         GDPopt = m.GDPopt_utils
         var_value_is_one = ComponentSet()
         var_value_is_zero = ComponentSet()
-        indicator_vars = ComponentSet(
-            disj.binary_indicator_var for disj in GDPopt.disjunct_list)
+        indicator_vars = GDPopt.indicator_binary_set
         for var, val in zip(GDPopt.variable_list, var_values):
             if not var.is_binary():
                 continue
@@ -257,7 +256,7 @@ def add_integer_cut(var_values, target_model, solve_data, config,
             config.logger.info(
                 'Adding integer cut to a model without discrete variables. '
                 'Model is now infeasible.')
-            if solve_data.objective_sense == minimize:
+            if solve_data.objective_is_minimize:
                 solve_data.LB = float('inf')
             else:
                 solve_data.UB = float('-inf')
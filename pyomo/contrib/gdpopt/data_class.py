@@ -10,9 +10,46 @@ class GDPoptSolveData(object):
         - working_model (ConcreteModel): the original model after preprocessing
         - results (SolverResults): Pyomo results objective
         - timing (Bunch): dictionary of time elapsed for solver functions
+        - best_solution_found (ConcreteModel): the solved subproblem that
+          gave the best feasible solution found
+        - best_solution_var_values (tuple): values of the variables in
+          GDPopt_utils.variable_list for the best feasible solution found
+
+    The solver state is read on every iteration (e.g. the LB and UB), so
+    the attributes above are declared as slots. The instance still has a
+    __dict__, so user callbacks (e.g. call_after_subproblem_solve) can
+    store their own attributes on solve_data.
 
     """
-    pass
+    __slots__ = (
+        'config',
+        'results',
+        'timing',
+        'original_model',
+        'working_model',
+        'linear_GDP',
+        'util_block_name',
+        'active_strategy',
+        'objective_sense',
+        'objective_is_minimize',
+        'initial_var_values',
+        'best_solution_found',
+        'best_solution_var_values',
+        'master_iteration',
+        'mip_iteration',
+        'nlp_iteration',
+        'LB',
+        'UB',
+        'iteration_log',
+        'feasible_solution_improved',
+        'mip_constraint_polynomial_degree',
+        # Logic-based branch and bound
+        'bb_queue',
+        'created_nodes',
+        'explored_nodes',
+        # Allow arbitrary attributes, e.g. set by user callbacks
+        '__dict__',
+    )
 
 
 class MasterProblemResult(object):
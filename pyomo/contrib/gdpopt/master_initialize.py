@@ -12,8 +12,7 @@ from pyomo.contrib.gdpopt.mip_solve import solve_linear_GDP
 from pyomo.contrib.gdpopt.nlp_solve import solve_disjunctive_subproblem
 from pyomo.contrib.gdpopt.util import _DoNothing
 from pyomo.core import (
-    Block, Constraint, Objective, Suffix, TransformationFactory, Var, maximize,
-    minimize
+    Block, Constraint, Objective, Suffix, TransformationFactory, Var, maximize
 )
 from pyomo.gdp import Disjunct
 
@@ -256,7 +255,7 @@ def solve_set_cover_mip(model, disj_needs_cover, solve_data, config):
                 'Set covering problem was infeasible. '
                 'Check your linear and logical constraints '
                 'for contradictions.')
-        if solve_data.objective_sense == minimize:
+        if solve_data.objective_is_minimize:
             solve_data.LB = float('inf')
         else:
             solve_data.UB = float('-inf')
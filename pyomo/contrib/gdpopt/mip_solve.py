@@ -8,9 +8,10 @@ from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.contrib.fbbt.fbbt import fbbt
 from pyomo.contrib.gdpopt.data_class import MasterProblemResult
 from pyomo.contrib.gdpopt.util import (SuppressInfeasibleWarning, _DoNothing,
-                                       get_main_elapsed_time)
+                                       get_main_elapsed_time,
+                                       _feasible_termination_conditions)
 from pyomo.core import (Block, Expression, Objective, TransformationFactory,
-                        Var, minimize, value, Constraint)
+                        Var, value, Constraint)
 from pyomo.gdp import Disjunct
 from pyomo.network import Port
 from pyomo.opt import SolutionStatus, SolverFactory
@@ -138,7 +139,7 @@ def solve_linear_GDP(linear_GDP_model, solve_data, config):
     mip_result.disjunct_values = list(
         disj.binary_indicator_var.value for disj in GDPopt.disjunct_list)
 
-    if terminate_cond in {tc.optimal, tc.locallyOptimal, tc.feasible}:
+    if terminate_cond in _feasible_termination_conditions:
         pass
     elif terminate_cond is tc.infeasible:
         config.logger.info(
@@ -199,7 +200,7 @@ def solve_LOA_master(solve_data, config):
     if solve_data.active_strategy == 'LOA':
         # Set up augmented Lagrangean penalty objective
         main_objective.deactivate()
-        sign_adjust = 1 if main_objective.sense == minimize else -1
+        sign_adjust = 1 if solve_data.objective_is_minimize else -1
         GDPopt.OA_penalty_expr = Expression(
             expr=sign_adjust * config.OA_penalty_factor *
             sum(v for v in m.component_data_objects(
@@ -218,16 +219,23 @@ def solve_LOA_master(solve_data, config):
 
     mip_result = solve_linear_GDP(m, solve_data, config)
     if mip_result.feasible:
-        if main_objective.sense == minimize:
-            solve_data.LB = max(value(obj_expr), solve_data.LB)
-        else:
-            solve_data.UB = min(value(obj_expr), solve_data.UB)
+        # Evaluate the objective expression once and reuse the value below.
+        obj_value = value(obj_expr)
+        # Only a master problem solved to optimality yields a valid bound.
+        # Feasible but unproven solutions (e.g. after hitting the time
+        # limit) are still used, but do not move the bound.
+        terminate_cond = mip_result.pyomo_results.solver.termination_condition
+        if terminate_cond is tc.optimal:
+            if solve_data.objective_is_minimize:
+                solve_data.LB = max(obj_value, solve_data.LB)
+            else:
+                solve_data.UB = min(obj_value, solve_data.UB)
         solve_data.iteration_log[
             (solve_data.master_iteration,
              solve_data.mip_iteration,
              solve_data.nlp_iteration)
         ] = (
-            value(obj_expr),
+            obj_value,
             value(base_obj_expr),
             mip_result.var_values
         )
@@ -237,7 +245,7 @@ def solve_LOA_master(solve_data, config):
                 solve_data.master_iteration,
                 solve_data.mip_iteration,
                 solve_data.nlp_iteration,
-                value(obj_expr),
+                obj_value,
                 solve_data.LB, solve_data.UB))
     else:
         # Master problem was infeasible.
@@ -246,7 +254,7 @@ def solve_LOA_master(solve_data, config):
                 'GDPopt initialization may have generated poor '
                 'quality cuts.')
         # set optimistic bound to infinity
-        if main_objective.sense == minimize:
+        if solve_data.objective_is_minimize:
             solve_data.LB = float('inf')
         else:
             solve_data.UB = float('-inf')
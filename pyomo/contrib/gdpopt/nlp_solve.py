@@ -18,8 +18,9 @@ from pyomo.common.collections import ComponentSet, ComponentMap
 from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.contrib.gdpopt.data_class import SubproblemResult
 from pyomo.contrib.gdpopt.util import (SuppressInfeasibleWarning,
-                                       is_feasible, get_main_elapsed_time)
-from pyomo.core import (Constraint, TransformationFactory, minimize, value,
+                                       is_feasible, get_main_elapsed_time,
+                                       _feasible_termination_conditions)
+from pyomo.core import (Constraint, TransformationFactory, value,
                         Objective, Block)
 from pyomo.core.expr import current as EXPR
 from pyomo.opt import SolverFactory, SolverResults
@@ -152,8 +153,7 @@ def solve_NLP(nlp_model, solve_data, config):
         for c in GDPopt.constraint_list)
 
     term_cond = results.solver.termination_condition
-    if any(term_cond == cond for cond in (tc.optimal, tc.locallyOptimal,
-                                          tc.feasible)):
+    if term_cond in _feasible_termination_conditions:
         pass
     elif term_cond == tc.infeasible:
         config.logger.info('NLP subproblem was infeasible.')
@@ -249,8 +249,7 @@ def solve_MINLP(model, solve_data, config):
         for c in GDPopt.constraint_list)
 
     term_cond = results.solver.termination_condition
-    if any(term_cond == cond for cond in (tc.optimal, tc.locallyOptimal,
-                                          tc.feasible)):
+    if term_cond in _feasible_termination_conditions:
         pass
     elif term_cond == tc.infeasible:
         config.logger.info('MINLP subproblem was infeasible.')
@@ -376,32 +375,40 @@ def update_subproblem_progress_indicators(solved_model, solve_data, config):
     GDPopt = solved_model.GDPopt_utils
     objective = next(solved_model.component_data_objects(Objective,
                                                          active=True))
-    if objective.sense == minimize:
+    # Evaluate the objective expression once and reuse the value below.
+    obj_value = value(objective.expr)
+    if solve_data.objective_is_minimize:
         old_UB = solve_data.UB
-        solve_data.UB = min(value(objective.expr), solve_data.UB)
+        solve_data.UB = min(obj_value, solve_data.UB)
         solve_data.feasible_solution_improved = (solve_data.UB < old_UB)
     else:
         old_LB = solve_data.LB
-        solve_data.LB = max(value(objective.expr), solve_data.LB)
+        solve_data.LB = max(obj_value, solve_data.LB)
         solve_data.feasible_solution_improved = (solve_data.LB > old_LB)
+    var_values = [v.value for v in GDPopt.variable_list]
     solve_data.iteration_log[
         (solve_data.master_iteration,
          solve_data.mip_iteration,
          solve_data.nlp_iteration)
     ] = (
-        value(objective.expr),
-        value(objective.expr),
-        [v.value for v in GDPopt.variable_list]
+        obj_value,
+        obj_value,
+        var_values
     )
 
     if solve_data.feasible_solution_improved:
-        solve_data.best_solution_found = solved_model.clone()
+        # Only the variable values are needed to restore the incumbent on
+        # the original model, so there is no need to clone the subproblem.
+        # It is already a fresh clone of the working model, so it is kept
+        # as best_solution_found for callbacks that read it.
+        solve_data.best_solution_found = solved_model
+        solve_data.best_solution_var_values = tuple(var_values)
 
     improvement_tag = (
         "(IMPROVED) " if solve_data.feasible_solution_improved else "")
     lb_improved, ub_improved = (
         ("", improvement_tag)
-        if objective.sense == minimize
+        if solve_data.objective_is_minimize
         else (improvement_tag, ""))
     config.logger.info(
         'ITER {:d}.{:d}.{:d}-NLP: OBJ: {:.10g}  LB: {:.10g} {:s} UB: {:.10g} '
@@ -409,7 +416,7 @@ def update_subproblem_progress_indicators(solved_model, solve_data, config):
             solve_data.master_iteration,
             solve_data.mip_iteration,
             solve_data.nlp_iteration,
-            value(objective.expr),
+            obj_value,
             solve_data.LB, lb_improved,
             solve_data.UB, ub_improved))
 
@@ -15,15 +15,18 @@ from math import fabs
 from os.path import join, normpath
 
 from io import StringIO
+from unittest.mock import patch
 
 import pyomo.common.unittest as unittest
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.collections import Bunch
 from pyomo.common.fileutils import import_file
 from pyomo.contrib.gdpopt.GDPopt import GDPoptSolver
-from pyomo.contrib.gdpopt.data_class import GDPoptSolveData
-from pyomo.contrib.gdpopt.mip_solve import solve_linear_GDP
-from pyomo.contrib.gdpopt.util import is_feasible, time_code
+from pyomo.contrib.gdpopt.data_class import (GDPoptSolveData,
+                                             MasterProblemResult)
+from pyomo.contrib.gdpopt.mip_solve import solve_linear_GDP, solve_LOA_master
+from pyomo.contrib.gdpopt.util import (copy_values_to_var_list, is_feasible,
+                                       time_code)
 from pyomo.environ import ( ConcreteModel, Objective, SolverFactory, Var, value,
                             Integers, Block, Constraint, maximize,
                             LogicalConstraint, sqrt)
@@ -145,6 +148,67 @@ class TestGDPoptUnit(unittest.TestCase):
                                     "objectives"):
             SolverFactory('gdpopt').solve(m, strategy='LOA')
 
+    def test_solve_data_accepts_user_attributes(self):
+        # User callbacks may store their own state on solve_data
+        solve_data = GDPoptSolveData()
+        solve_data.LB = 1
+        solve_data.my_callback_counter = 3
+        self.assertEqual(solve_data.LB, 1)
+        self.assertEqual(solve_data.my_callback_counter, 3)
+
+    def test_copy_values_to_var_list(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var(domain=Integers)
+        m.z = Var()
+        m.z.fix(4)
+        config = GDPoptSolver.CONFIG()
+        copy_values_to_var_list((1.5, 2, 7), [m.x, m.y, m.z], config)
+        self.assertEqual(value(m.x), 1.5)
+        self.assertEqual(value(m.y), 2)
+        # Fixed variables are skipped
+        self.assertEqual(value(m.z), 4)
+
+    def _solve_master_with_termination_condition(self, term_cond):
+        m = ConcreteModel()
+        m.x = Var(initialize=2)
+        m.o = Objective(expr=m.x)
+        m.GDPopt_utils = Block()
+        solve_data = GDPoptSolveData()
+        solve_data.linear_GDP = m
+        solve_data.active_strategy = 'GLOA'
+        solve_data.objective_is_minimize = True
+        solve_data.master_iteration = 1
+        solve_data.mip_iteration = 0
+        solve_data.nlp_iteration = 0
+        solve_data.LB = float('-inf')
+        solve_data.UB = float('inf')
+        solve_data.iteration_log = {}
+
+        mip_result = MasterProblemResult()
+        mip_result.feasible = True
+        mip_result.var_values = [2]
+        mip_result.pyomo_results = Bunch(
+            solver=Bunch(termination_condition=term_cond))
+        with patch('pyomo.contrib.gdpopt.mip_solve.solve_linear_GDP',
+                   return_value=mip_result):
+            solve_LOA_master(
+                solve_data, GDPoptSolver.CONFIG(dict(strategy='GLOA')))
+        return solve_data
+
+    def test_master_feasible_not_optimal_keeps_bounds(self):
+        solve_data = self._solve_master_with_termination_condition(
+            TerminationCondition.feasible)
+        self.assertEqual(solve_data.LB, float('-inf'))
+        self.assertEqual(solve_data.UB, float('inf'))
+        self.assertEqual(len(solve_data.iteration_log), 1)
+
+    def test_master_optimal_updates_bound(self):
+        solve_data = self._solve_master_with_termination_condition(
+            TerminationCondition.optimal)
+        self.assertEqual(solve_data.LB, 2)
+        self.assertEqual(solve_data.UB, float('inf'))
+
     def test_is_feasible_function(self):
         m = ConcreteModel()
         m.x = Var(bounds=(0, 3), initialize=2)
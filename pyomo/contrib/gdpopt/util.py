@@ -27,11 +27,18 @@ from pyomo.core.expr.current import identify_variables
 from pyomo.core.base.var import VarList
 from pyomo.gdp import Disjunct, Disjunction
 from pyomo.opt import SolverFactory, SolverResults
+from pyomo.opt import TerminationCondition as tc
 from pyomo.opt.results import ProblemSense
 from pyomo.repn.standard_repn import generate_standard_repn
 from pyomo.util.model_size import build_model_size_report
 from pyomo.core.expr import current as EXPR
 
+# Termination conditions for which a MIP master or NLP subproblem solution
+# is accepted as feasible.
+_feasible_termination_conditions = frozenset(
+    (tc.optimal, tc.locallyOptimal, tc.feasible))
+
+
 class _DoNothing(object):
     """Do nothing, literally.
 
@@ -178,23 +185,29 @@ def process_objective(solve_data, config, move_objective=False,
     """
     m = solve_data.working_model
     util_blk = getattr(m, solve_data.util_block_name)
-    # Handle missing or multiple objectives
-    active_objectives = list(m.component_data_objects(
-        ctype=Objective, active=True, descend_into=True))
-    solve_data.results.problem.number_of_objectives = len(active_objectives)
-    if len(active_objectives) == 0:
+    # Handle missing or multiple objectives. We only need to know whether
+    # there are zero, one, or more active objectives, so stop the model
+    # traversal as soon as a second one is found.
+    active_objectives = m.component_data_objects(
+        ctype=Objective, active=True, descend_into=True)
+    main_obj = next(active_objectives, None)
+    if main_obj is None:
+        solve_data.results.problem.number_of_objectives = 0
         config.logger.warning(
             'Model has no active objectives. Adding dummy objective.')
         util_blk.dummy_objective = Objective(expr=1)
         main_obj = util_blk.dummy_objective
-    elif len(active_objectives) > 1:
+    elif next(active_objectives, None) is not None:
         raise ValueError('Model has multiple active objectives.')
     else:
-        main_obj = active_objectives[0]
+        solve_data.results.problem.number_of_objectives = 1
     solve_data.results.problem.sense = ProblemSense.minimize if \
                                        main_obj.sense == 1 else \
                                        ProblemSense.maximize
     solve_data.objective_sense = main_obj.sense
+    # The sense is fixed for the whole solve; cache the comparison so that
+    # the per-iteration bound updates can branch on a plain bool.
+    solve_data.objective_is_minimize = main_obj.sense == minimize
 
     # Move the objective to the constraints if it is nonlinear or move_objective is True.
     if main_obj.expr.polynomial_degree() not in obj_handleable_polynomial_degree or move_objective:
@@ -256,35 +269,50 @@ def copy_var_list_values(from_list, to_list, config,
     for v_from, v_to in zip(from_list, to_list):
         if skip_stale and v_from.stale:
             continue  # Skip stale variable values.
-        if skip_fixed and v_to.is_fixed():
-            continue  # Skip fixed variables.
-        try:
-            # We don't want to trigger the reset of the global stale
-            # indicator, so we will set this variable to be "stale",
-            # knowing that set_value will switch it back to "not
-            # stale"
-            v_to.stale = True
-            # NOTE: PEP 2180 changes the var behavior so that domain /
-            # bounds violations no longer generate exceptions (and
-            # instead log warnings).  This means that the following will
-            # always succeed and the ValueError should never be raised.
-            v_to.set_value(value(v_from, exception=False), skip_validation=True)
-        except ValueError as err:
-            err_msg = getattr(err, 'message', str(err))
-            var_val = value(v_from)
-            rounded_val = int(round(var_val))
-            # Check to see if this is just a tolerance issue
-            if ignore_integrality and v_to.is_integer():
-                v_to.set_value(var_val, skip_validation=True)
-            elif v_to.is_integer() and (fabs(var_val - rounded_val) <=
-                                        config.integer_tolerance):
-                v_to.set_value(rounded_val, skip_validation=True)
-            elif abs(var_val) <= config.zero_tolerance and 0 in v_to.domain:
-                v_to.set_value(0, skip_validation=True)
-            else:
-                config.logger.error(
-                    'Unknown validation domain error setting variable %s', (v_to.name,))
-                raise
+        _set_var_value(v_to, value(v_from, exception=False), config,
+                       skip_fixed, ignore_integrality)
+
+
+def copy_values_to_var_list(values, to_list, config, skip_fixed=True,
+                            ignore_integrality=False):
+    """Copy a sequence of values onto a list of variables.
+
+    Same as copy_var_list_values, but the values are given directly rather
+    than read from another list of variables.
+    """
+    for var_val, v_to in zip(values, to_list):
+        _set_var_value(v_to, var_val, config, skip_fixed, ignore_integrality)
+
+
+def _set_var_value(v_to, var_val, config, skip_fixed, ignore_integrality):
+    if skip_fixed and v_to.is_fixed():
+        return  # Skip fixed variables.
+    try:
+        # We don't want to trigger the reset of the global stale
+        # indicator, so we will set this variable to be "stale",
+        # knowing that set_value will switch it back to "not
+        # stale"
+        v_to.stale = True
+        # NOTE: PEP 2180 changes the var behavior so that domain /
+        # bounds violations no longer generate exceptions (and
+        # instead log warnings).  This means that the following will
+        # always succeed and the ValueError should never be raised.
+        v_to.set_value(var_val, skip_validation=True)
+    except ValueError as err:
+        err_msg = getattr(err, 'message', str(err))
+        rounded_val = int(round(var_val))
+        # Check to see if this is just a tolerance issue
+        if ignore_integrality and v_to.is_integer():
+            v_to.set_value(var_val, skip_validation=True)
+        elif v_to.is_integer() and (fabs(var_val - rounded_val) <=
+                                    config.integer_tolerance):
+            v_to.set_value(rounded_val, skip_validation=True)
+        elif abs(var_val) <= config.zero_tolerance and 0 in v_to.domain:
+            v_to.set_value(0, skip_validation=True)
+        else:
+            config.logger.error(
+                'Unknown validation domain error setting variable %s', (v_to.name,))
+            raise
 
 
 def is_feasible(model, config):
@@ -373,6 +401,12 @@ def build_ordered_component_lists(model, solve_data):
             model.component_data_objects(
                 ctype=Disjunct, active=True,
                 descend_into=(Block, Disjunct))))
+    # The disjunct binary indicator variables do not change during the
+    # solve, so we collect them once rather than on every integer cut.
+    setattr(
+        util_blk, 'indicator_binary_set', ComponentSet(
+            disj.binary_indicator_var
+            for disj in getattr(util_blk, 'disjunct_list')))
     setattr(
         util_blk, 'disjunction_list', list(
             model.component_data_objects(
@@ -396,8 +430,7 @@ def build_ordered_component_lists(model, solve_data):
     # fact, if we consider them Logical variables, they should not appear in
     # active algebraic constraints. For now, they need to be added to the
     # variable set.
-    for disj in getattr(util_blk, 'disjunct_list'):
-        var_set.add(disj.binary_indicator_var)
+    var_set.update(getattr(util_blk, 'indicator_binary_set'))
 
     # We use component_data_objects rather than list(var_set) in order to
     # preserve a deterministic ordering.
@@ -596,6 +629,7 @@ def setup_solver_environment(model, config):
         solve_data.initial_var_values = list(
             v.value for v in util_block.variable_list)
         solve_data.best_solution_found = None
+        solve_data.best_solution_var_values = None
 
         # Integer cuts exclude particular discrete decisions
         util_block.integer_cuts = ConstraintList(doc='integer cuts')
@@ -616,14 +650,12 @@ def setup_solver_environment(model, config):
 
         yield solve_data  # yield setup solver environment
 
-        if (solve_data.best_solution_found is not None and
-            solve_data.best_solution_found is not solve_data.original_model):
+        if solve_data.best_solution_var_values is not None:
             # Update values on the original model
-            copy_var_list_values(
-                from_list=solve_data.best_solution_found.GDPopt_utils.\
-                variable_list,
-                to_list=solve_data.original_model.GDPopt_utils.variable_list,
-                config=config)
+            copy_values_to_var_list(
+                solve_data.best_solution_var_values,
+                solve_data.original_model.GDPopt_utils.variable_list,
+                config)
 
     # Finalize results object
     solve_data.results.problem.lower_bound = solve_data.LB
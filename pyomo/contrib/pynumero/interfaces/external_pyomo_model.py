@@ -10,9 +10,8 @@
 #  ___________________________________________________________________________
 
 import itertools
+import warnings
 from pyomo.environ import SolverFactory
-from pyomo.core.base.var import Var
-from pyomo.core.base.constraint import Constraint
 from pyomo.core.base.objective import Objective
 from pyomo.core.expr.visitor import identify_variables
 from pyomo.common.collections import ComponentSet
@@ -36,8 +35,21 @@ from pyomo.contrib.incidence_analysis.util import (
     generate_strongly_connected_components,
 )
 import numpy as np
+import scipy.linalg
 import scipy.sparse as sps
 
+# jgy is factorized with a dense LU decomposition if it has fewer rows
+# than this, or if the fraction of its entries that are nonzero is at
+# least this density. Otherwise SuperLU is used.
+_DENSE_LU_MAX_DIM = 256
+_DENSE_LU_MIN_DENSITY = 0.2
+
+# Tolerance on the infinity norm of the residuals and iteration limit used
+# when solving strongly connected components of the external equations
+# with Newton's method.
+_NEWTON_TOL = 1e-8
+_NEWTON_MAX_ITER = 20
+
 
 def _dense_to_full_sparse(matrix):
     """
@@ -70,39 +82,123 @@ def _dense_to_full_sparse(matrix):
     return sps.coo_matrix((data, (row, col)), shape=(nrow, ncol))
 
 
+def _dense_to_lower_triangular_sparse(matrix):
+    """
+    Used to convert a dense symmetric matrix (2d NumPy array) to a SciPy
+    sparse matrix containing its lower triangle, with explicit coordinates
+    for every entry in the lower triangle, including zeros. Entries are in
+    the same (row-major) order as in sps.tril(_dense_to_full_sparse(matrix)),
+    but the upper triangle is never converted to sparse format.
+    """
+    nrow, ncol = matrix.shape
+    row, col = np.tril_indices(nrow, m=ncol)
+    data = matrix[row, col]
+    return sps.coo_matrix((data, (row, col)), shape=(nrow, ncol))
+
+
+class _DenseLUFactor(object):
+    """
+    Dense LU factorization of a square matrix, with the same solve
+    interface as the SuperLU object returned by scipy.sparse.linalg.splu.
+    Unlike SuperLU, solve may overwrite the right-hand-side array, so it
+    should only be called with temporary arrays.
+    """
+
+    _trans_map = {"N": 0, "T": 1, "H": 2}
+
+    def __init__(self, matrix):
+        with warnings.catch_warnings():
+            # A singular matrix is reported below with the same error
+            # as SuperLU, rather than a LinAlgWarning.
+            warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+            self._lu_piv = scipy.linalg.lu_factor(matrix)
+        if np.any(np.diag(self._lu_piv[0]) == 0):
+            raise RuntimeError("Factor is exactly singular")
+
+    def solve(self, rhs, trans="N"):
+        return scipy.linalg.lu_solve(
+            self._lu_piv, rhs, trans=self._trans_map[trans], overwrite_b=True
+        )
+
+
+def _factorize(matrix):
+    """
+    Returns a factorization of a square sparse matrix that supports
+    solve(rhs, trans). Small or relatively dense matrices are converted
+    to dense and factorized with LAPACK, as this is faster than SuperLU
+    for these matrices.
+    """
+    n = matrix.shape[0]
+    if n < _DENSE_LU_MAX_DIM or matrix.nnz >= _DENSE_LU_MIN_DENSITY*n*n:
+        return _DenseLUFactor(matrix.toarray())
+    else:
+        return sps.linalg.splu(matrix.tocsc())
+
+
+def _hessians_along_dydx(hxx, hxy, hyy, dydx):
+    """
+    Given stacked Hessians of a set of constraints with respect to
+    (x, x), (x, y), and (y, y), with shapes (n, nx, nx), (n, nx, ny), and
+    (n, ny, ny), computes the Hessians of these constraints with respect to
+    x along the implicit function y(x), excluding the term that involves
+    d2ydx2. This is the tensor
+
+        hxx + hxy.dydx + (hxy.dydx)^T + dydx^T.hyy.dydx
+
+    where the transpose is over the last two axes.
+    """
+    # Each product below is a single BLAS call (tensor.dot(matrix)) or a
+    # loop over BLAS calls in compiled code (matmul of stacked matrices),
+    # and the terms are accumulated in place into the first result.
+    #
+    # out[i,:,:] = dydx^T.hyy[i,:,:].dydx
+    out = np.matmul(dydx.transpose(), hyy.dot(dydx))
+    # prod[i,j,k] = sum(hxy[i,j,:] * dydx[:,k])
+    prod = hxy.dot(dydx)
+    # The hxx term is sparse, but we do not exploit it.
+    out += hxx
+    out += prod
+    out += prod.transpose((0, 2, 1))
+    return out
+
+
 def get_hessian_of_constraint(constraint, wrt1=None, wrt2=None, nlp=None):
     constraints = [constraint]
     if wrt1 is None and wrt2 is None:
         variables = list(identify_variables(constraint.expr, include_fixed=False))
         wrt1 = variables
         wrt2 = variables
-    elif wrt1 is not None and wrt2 is not None:
-        variables = wrt1 + wrt2
-    elif wrt1 is not None: # but wrt2 is None
+    elif wrt1 is not None and wrt2 is None:
         wrt2 = wrt1
-        variables = wrt1
-    else:
+    elif wrt1 is None:
         # wrt2 is not None and wrt1 is None
         wrt1 = wrt2
-        variables = wrt1
 
     if nlp is None:
-        block = create_subsystem_block(constraints, variables=variables)
-        # Could fix input_vars so I don't evaluate the Hessian with respect
-        # to variables I don't care about...
-
-        # HUGE HACK: Variables not included in a constraint are not written
-        # to the nl file, so we cannot take the derivative with respect to
-        # them, even though we know this derivative is zero. To work around,
-        # we make sure all variables appear on the block in the form of a
-        # dummy constraint. Then we can take derivatives of any constraint
-        # with respect to them. Conveniently, the extract_submatrix_
-        # call deals with extracting the variables and constraint we care
-        # about, in the proper order.
-        block._dummy_var = Var()
-        block._dummy_con = Constraint(expr=sum(variables) == block._dummy_var)
+        # Variables not included in a constraint are not written to the
+        # nl file, so we cannot take the derivative with respect to them.
+        # These derivatives are zero, so we only build the NLP with the
+        # variables that appear in the constraint, then place the resulting
+        # submatrix in the coordinates of the requested variables.
+        present = ComponentSet(
+            identify_variables(constraint.expr, include_fixed=False)
+        )
+        rows = [i for i, var in enumerate(wrt1) if var in present]
+        cols = [j for j, var in enumerate(wrt2) if var in present]
+        shape = (len(wrt1), len(wrt2))
+        if not rows or not cols:
+            return sps.coo_matrix(shape)
+        nlp_wrt1 = [wrt1[i] for i in rows]
+        nlp_wrt2 = [wrt2[j] for j in cols]
+
+        block = create_subsystem_block(constraints, variables=list(present))
         block._obj = Objective(expr=0.0)
         nlp = PyomoNLP(block)
+    else:
+        rows = None
+        cols = None
+        nlp_wrt1 = wrt1
+        nlp_wrt2 = wrt2
 
     saved_duals = nlp.get_duals()
     saved_obj_factor = nlp.get_obj_factor()
@@ -117,10 +213,18 @@ def get_hessian_of_constraint(constraint, wrt1=None, wrt2=None, nlp=None):
 
     # NOTE: The returned matrix preserves explicit zeros. I.e. it contains
     # coordinates for every entry that could possibly be nonzero.
-    submatrix = nlp.extract_submatrix_hessian_lag(wrt1, wrt2)
+    submatrix = nlp.extract_submatrix_hessian_lag(nlp_wrt1, nlp_wrt2)
 
     nlp.set_obj_factor(saved_obj_factor)
     nlp.set_duals(saved_duals)
+
+    if rows is not None:
+        rows = np.array(rows, dtype=int)
+        cols = np.array(cols, dtype=int)
+        submatrix = sps.coo_matrix(
+            (submatrix.data, (rows[submatrix.row], cols[submatrix.col])),
+            shape=shape,
+        )
     return submatrix
 
 
@@ -172,6 +276,12 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
             that have dimension greater than one. Only used if use_cyipopt
             is False.
 
+        Strongly connected components of dimension greater than one are
+        first solved with Newton's method, using derivatives from this
+        model's NLP. CyIpopt or the solver is only used for a component
+        if Newton's method does not converge to a point within the bounds
+        of its variables.
+
         """
         if use_cyipopt is None:
             use_cyipopt = cyipopt_available
@@ -200,11 +310,47 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
                 )
         self._block._obj = Objective(expr=0.0)
         self._nlp = PyomoNLP(self._block)
+        # This NLP is reused for every input value. Cache the coordinates
+        # of the inputs and external variables so we can update its primals
+        # in place after each solve of the external equations.
+        self._primal_indices = np.array(
+            self._nlp.get_primal_indices(input_vars + external_vars)
+        )
+        # Likewise for the residual and external constraints, which are
+        # used to set duals and select constraint Hessians.
+        self._constraint_indices = np.array(
+            self._nlp.get_constraint_indices(residual_cons + external_cons)
+        )
+        # Factorization of jgy and the corresponding dydx at the current
+        # primals. These are computed on demand and reset whenever new
+        # input values are set.
+        self._jgy_fact = None
+        self._dydx = None
+        # Input values at which the NLP's primals were last updated
+        self._last_input_values = None
 
         self._scc_list = list(generate_strongly_connected_components(
             external_cons, variables=external_vars
         ))
 
+        # Coordinates in the NLP of the variables, inputs, and constraints
+        # of each strongly connected component of dimension > 1. These are
+        # used to try solving these components with Newton's method before
+        # calling a solver.
+        self._vector_scc_coords = []
+        for scc, inputs in self._scc_list:
+            if len(scc.vars) > 1:
+                variables = list(scc.vars.values())
+                inputs = list(inputs)
+                constraints = list(scc.cons.values())
+                self._vector_scc_coords.append((
+                    variables,
+                    np.array(self._nlp.get_primal_indices(variables)),
+                    inputs,
+                    np.array(self._nlp.get_primal_indices(inputs), dtype=int),
+                    np.array(self._nlp.get_constraint_indices(constraints)),
+                ))
+
         if use_cyipopt:
             # Using CyIpopt allows us to solve inner problems without
             # costly rewriting of the nl file. It requires quite a bit
@@ -260,30 +406,94 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         self.residual_cons = residual_cons
         self.external_cons = external_cons
 
+        # These are queried by the grey box NLP on every evaluation,
+        # so we compute them once.
+        self._n_inputs = len(input_vars)
+        self._n_equality_constraints = len(residual_cons)
+        self._input_names = tuple(
+            "input_%i" % i for i in range(self._n_inputs)
+        )
+        self._equality_constraint_names = tuple(
+            "residual_%i" % i for i in range(self._n_equality_constraints)
+        )
+
         self.residual_con_multipliers = [None for _ in residual_cons]
         self.residual_scaling_factors = None
 
     def n_inputs(self):
-        return len(self.input_vars)
+        return self._n_inputs
 
     def n_equality_constraints(self):
-        return len(self.residual_cons)
+        return self._n_equality_constraints
 
     # I would like to try to get by without using the following "name" methods.
+    # These return new lists so callers cannot modify the cached names.
     def input_names(self):
-        return ["input_%i" % i for i in range(self.n_inputs())]
+        return list(self._input_names)
     def equality_constraint_names(self):
-        return ["residual_%i" % i for i in range(self.n_equality_constraints())]
+        return list(self._equality_constraint_names)
 
     def set_input_values(self, input_values):
-        solver = self._solver
-        external_cons = self.external_cons
         external_vars = self.external_vars
         input_vars = self.input_vars
 
+        input_values = np.array(input_values, dtype=float)
+        prev_y = None
+        if self._dydx is not None and self._last_input_values is not None:
+            # Initialize the external variables with a first-order
+            # prediction of their values at the new inputs, using dydx
+            # at the previous inputs, which has already been computed.
+            # This is usually a much better starting point for the
+            # solves below than the previous values of these variables.
+            nx = len(input_vars)
+            prev_y = self._nlp.get_primals()[self._primal_indices[nx:]]
+            dx = input_values - self._last_input_values
+            pred_y = prev_y + self._dydx.dot(dx)
+            for var, val in zip(external_vars, pred_y):
+                if var.lb is not None and val < var.lb:
+                    val = var.lb
+                elif var.ub is not None and val > var.ub:
+                    val = var.ub
+                var.set_value(val, skip_validation=True)
+
+        self._jgy_fact = None
+        self._dydx = None
+
         for var, val in zip(input_vars, input_values):
             var.set_value(val, skip_validation=True)
 
+        if prev_y is None:
+            self._solve_external_equations()
+        else:
+            try:
+                self._solve_external_equations()
+            except (ArithmeticError, RuntimeError, ValueError):
+                # The prediction can be a poor starting point if the inputs
+                # have changed by a lot. In this case, start again from the
+                # values of the external variables at the previous inputs.
+                for var, val in zip(external_vars, prev_y):
+                    var.set_value(val, skip_validation=True)
+                self._solve_external_equations()
+
+        # Send updated variable values to NLP for dervative evaluation
+        primals = self._nlp.get_primals()
+        values = np.fromiter(
+            (var.value for var in itertools.chain(input_vars, external_vars)),
+            float,
+            count=len(self._primal_indices),
+        )
+        primals[self._primal_indices] = values
+        self._nlp.set_primals(primals)
+        self._last_input_values = input_values
+
+    def _solve_external_equations(self):
+        """
+        Solves the external constraints for the external variables, one
+        strongly connected component at a time, with the inputs fixed at
+        their current values.
+
+        """
+        solver = self._solver
         vector_scc_idx = 0
         for block, inputs in self._scc_list:
             if len(block.vars) == 1:
@@ -291,7 +501,10 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
                     block.vars[0], block.cons[0]
                 )
             else:
-                if self._use_cyipopt:
+                # Try Newton's method with derivatives from the NLP we
+                # already have, and only call a solver if it fails.
+                converged = self._solve_vector_scc_with_newton(vector_scc_idx)
+                if not converged and self._use_cyipopt:
                     # Transfer variable values into the projected NLP, solve,
                     # and extract values.
 
@@ -328,7 +541,7 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
                     for var, val in zip(variables, new_primals):
                         var.set_value(val, skip_validation=True)
 
-                else:
+                elif not converged:
                     # Use a Pyomo solver to solve this strongly connected
                     # component.
                     with TemporarySubsystemManager(to_fix=inputs):
@@ -336,13 +549,62 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
 
                 vector_scc_idx += 1
 
-        # Send updated variable values to NLP for dervative evaluation
-        primals = self._nlp.get_primals()
-        to_update = input_vars + external_vars
-        indices = self._nlp.get_primal_indices(to_update)
-        values = np.fromiter((var.value for var in to_update), float)
-        primals[indices] = values
-        self._nlp.set_primals(primals)
+    def _solve_vector_scc_with_newton(self, vector_scc_idx):
+        """
+        Attempts to solve a strongly connected component of dimension
+        greater than one with Newton's method, using derivatives from the
+        NLP of the entire model. If the iteration converges to a point
+        within the variables' bounds, sets the values of the variables and
+        returns True. Otherwise, leaves the variables unchanged and returns
+        False.
+
+        The NLP can only evaluate all of its constraints and the full
+        Jacobian, so each iteration evaluates the entire model and then
+        extracts the rows and columns of this component. The cost of an
+        iteration therefore grows with the size of the model, not the
+        size of the component.
+
+        """
+        variables, var_coords, inputs, input_coords, con_coords = (
+            self._vector_scc_coords[vector_scc_idx]
+        )
+        if any(var.value is None for var in variables):
+            return False
+
+        nlp = self._nlp
+        primals = nlp.get_primals()
+        primals[input_coords] = [var.value for var in inputs]
+        y = np.array([var.value for var in variables], dtype=float)
+        converged = False
+        try:
+            for _ in range(_NEWTON_MAX_ITER):
+                primals[var_coords] = y
+                nlp.set_primals(primals)
+                resid = nlp.evaluate_constraints()[con_coords]
+                if np.max(np.abs(resid)) <= _NEWTON_TOL:
+                    converged = True
+                    break
+                jac = nlp.evaluate_jacobian().tocsr()[con_coords, :]
+                jac = jac[:, var_coords]
+                dy = _factorize(jac).solve(-resid)
+                if not np.all(np.isfinite(dy)):
+                    break
+                y = y + dy
+        except (AssertionError, ArithmeticError, RuntimeError, ValueError):
+            # ASL raises AssertionError for failed evaluations, and a
+            # singular Jacobian raises a RuntimeError from SuperLU.
+            return False
+
+        if not converged:
+            return False
+        for var, val in zip(variables, y):
+            if var.lb is not None and val < var.lb - _NEWTON_TOL:
+                return False
+            if var.ub is not None and val > var.ub + _NEWTON_TOL:
+                return False
+        for var, val in zip(variables, y):
+            var.set_value(val, skip_validation=True)
+        return True
 
     def set_equality_constraint_multipliers(self, eq_con_multipliers):
         """
@@ -359,12 +621,10 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
             eq_con_multipliers,
         )
         multipliers = np.concatenate((eq_con_multipliers, external_multipliers))
-        cons = self.residual_cons + self.external_cons
-        n_con = len(cons)
+        n_con = len(self._constraint_indices)
         assert n_con == self._nlp.n_constraints()
         duals = np.zeros(n_con)
-        indices = self._nlp.get_constraint_indices(cons)
-        duals[indices] = multipliers
+        duals[self._constraint_indices] = multipliers
         self._nlp.set_duals(duals)
 
     def calculate_external_constraint_multipliers(self, resid_multipliers):
@@ -383,13 +643,13 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         nlp = self._nlp
         y = self.external_vars
         f = self.residual_cons
-        g = self.external_cons
         jfy = nlp.extract_submatrix_jacobian(y, f)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
 
-        jgy_t = jgy.transpose()
+        # Solve with the transpose of the (cached) factorization of jgy
+        jgy_fact, _ = self._factorize_jgy_and_evaluate_dydx()
         jfy_t = jfy.transpose()
-        dfdg = - sps.linalg.splu(jgy_t.tocsc()).solve(jfy_t.toarray())
+        dfdg = jgy_fact.solve(jfy_t.toarray(), trans="T")
+        np.negative(dfdg, out=dfdg)
         resid_multipliers = np.array(resid_multipliers)
         external_multipliers = dfdg.dot(resid_multipliers)
         return external_multipliers
@@ -423,13 +683,13 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         hlxx = hlxx.toarray()
         hlxy = hlxy.toarray()
         hlyy = hlyy.toarray()
-        dydx = self.evaluate_jacobian_external_variables()
-        term1 = hlxx
-        prod = hlxy.dot(dydx)
-        term2 = prod + prod.transpose()
-        term3 = hlyy.dot(dydx).transpose().dot(dydx)
-        hess_lag = term1 + term2 + term3
-        return hess_lag
+        _, dydx = self._factorize_jgy_and_evaluate_dydx()
+        # This is the same contraction we perform for individual constraint
+        # Hessians, applied to a single "stack" of Hessians.
+        hess_lag = _hessians_along_dydx(
+            hlxx[np.newaxis], hlxy[np.newaxis], hlyy[np.newaxis], dydx
+        )
+        return hess_lag[0]
 
     def evaluate_equality_constraints(self):
         return self._nlp.extract_subvector_constraints(self.residual_cons)
@@ -439,21 +699,14 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         x = self.input_vars
         y = self.external_vars
         f = self.residual_cons
-        g = self.external_cons
         jfx = nlp.extract_submatrix_jacobian(x, f)
         jfy = nlp.extract_submatrix_jacobian(y, f)
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
-
-        nf = len(f)
-        nx = len(x)
-        n_entries = nf*nx
 
         # TODO: Does it make sense to cast dydx to a sparse matrix?
         # My intuition is that it does only if jgy is "decomposable"
         # in the strongly connected component sense, which is probably
         # not usually the case.
-        dydx = -1 * sps.linalg.splu(jgy.tocsc()).solve(jgx.toarray())
+        _, dydx = self._factorize_jgy_and_evaluate_dydx()
         # NOTE: PyNumero block matrices require this to be a sparse matrix
         # that contains coordinates for every entry that could possibly
         # be nonzero. Here, this is all of the entries.
@@ -461,61 +714,111 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
 
         return _dense_to_full_sparse(dfdx)
 
+    def _factorize_jgy_and_evaluate_dydx(self):
+        """
+        Factorizes the Jacobian of the external constraints with respect
+        to the external variables and uses this factorization to compute
+        dydx. The factorization is returned so that callers can reuse it
+        for further solves with the same matrix. Both are cached until
+        new input values are set.
+
+        """
+        if self._jgy_fact is None:
+            nlp = self._nlp
+            x = self.input_vars
+            y = self.external_vars
+            g = self.external_cons
+            jgx = nlp.extract_submatrix_jacobian(x, g)
+            jgy = nlp.extract_submatrix_jacobian(y, g)
+            self._jgy_fact = _factorize(jgy)
+            # jgx is typically much denser than jgy, and dydx is dense,
+            # so we solve with a dense right-hand-side. The solution is
+            # negated in place to avoid another (ny, nx) temporary.
+            dydx = self._jgy_fact.solve(jgx.toarray())
+            np.negative(dydx, out=dydx)
+            self._dydx = dydx
+        return self._jgy_fact, self._dydx
+
     def evaluate_jacobian_external_variables(self):
-        nlp = self._nlp
-        x = self.input_vars
-        y = self.external_vars
-        g = self.external_cons
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
-        jgy_csc = jgy.tocsc()
-        dydx = -1 * sps.linalg.splu(jgy_csc).solve(jgx.toarray())
-        return dydx
+        _, dydx = self._factorize_jgy_and_evaluate_dydx()
+        # Return a copy so callers cannot modify the cached array
+        return dydx.copy()
 
     def evaluate_hessian_external_variables(self):
+        jgy_fact, dydx = self._factorize_jgy_and_evaluate_dydx()
+        nf = self._n_equality_constraints
+        g_indices = self._constraint_indices[nf:]
+        hgxx, hgxy, hgyy = self._get_hessians_of_constraints(g_indices)
+        return self._evaluate_hessian_external_variables(
+            jgy_fact, dydx, hgxx, hgxy, hgyy
+        )
+
+    def _get_hessians_of_constraints(self, con_indices):
+        """
+        Returns three 3-D arrays containing, for each of the constraints
+        at the provided coordinates in the NLP, its Hessian with respect
+        to (x, x), (x, y), and (y, y). The Hessian of the Lagrangian is
+        evaluated once per constraint, with a unit multiplier on that
+        constraint, and all three blocks are sliced out of this single
+        evaluation. Duals and the objective factor are saved and restored
+        once for all the constraints, so callers that need Hessians of
+        several sets of constraints should request them together.
+
+        """
         nlp = self._nlp
+        nx = len(self.input_vars)
+        ix = self._primal_indices[:nx]
+        iy = self._primal_indices[nx:]
+
+        saved_duals = nlp.get_duals()
+        saved_obj_factor = nlp.get_obj_factor()
+        nlp.set_obj_factor(0.0)
+
+        # Hessians are written directly from their sparse coordinates into
+        # one contiguous buffer. toarray zeroes each slice of the buffer
+        # before writing to it, so it does not need to be initialized.
+        n_primals = nlp.n_primals()
+        hess = np.empty((len(con_indices), n_primals, n_primals))
+        temp_duals = np.zeros(len(saved_duals))
+        for i, idx in enumerate(con_indices):
+            # NOTE: This makes the same assumption about how the Lagrangian
+            # is constructed as get_hessian_of_constraint.
+            temp_duals[idx] = 1.0
+            nlp.set_duals(temp_duals)
+            nlp.evaluate_hessian_lag().tocoo().toarray(out=hess[i])
+            temp_duals[idx] = 0.0
+
+        nlp.set_obj_factor(saved_obj_factor)
+        nlp.set_duals(saved_duals)
+
+        hxx = hess[:, ix[:, None], ix]
+        hxy = hess[:, ix[:, None], iy]
+        hyy = hess[:, iy[:, None], iy]
+        return hxx, hxy, hyy
+
+    def _evaluate_hessian_external_variables(
+        self, jgy_fact, dydx, hgxx, hgxy, hgyy
+    ):
+        """
+        Computes d2ydx2 from an existing factorization of the Jacobian of
+        the external constraints with respect to the external variables,
+        the corresponding dydx, and the Hessians of the external
+        constraints. All right-hand-sides are solved with this single
+        factorization.
+
+        """
         x = self.input_vars
         y = self.external_vars
-        g = self.external_cons
-        jgx = nlp.extract_submatrix_jacobian(x, g)
-        jgy = nlp.extract_submatrix_jacobian(y, g)
-        jgy_csc = jgy.tocsc()
-        jgy_fact = sps.linalg.splu(jgy_csc)
-        dydx = -1 * jgy_fact.solve(jgx.toarray())
 
         ny = len(y)
         nx = len(x)
 
-        hgxx = np.array([
-            get_hessian_of_constraint(con, x, nlp=nlp).toarray() for con in g
-            ])
-        hgxy = np.array([
-            get_hessian_of_constraint(con, x, y, nlp=nlp).toarray() for con in g
-            ])
-        hgyy = np.array([
-            get_hessian_of_constraint(con, y, nlp=nlp).toarray() for con in g
-            ])
-
-        # This term is sparse, but we do not exploit it.
-        term1 = hgxx
-
-        # This is what we want.
-        # prod[i,j,k] = sum(hgxy[i,:,j] * dydx[:,k])
-        prod = hgxy.dot(dydx)
-        # Swap the second and third axes of the tensor
-        term2 = prod + prod.transpose((0, 2, 1))
-        # The term2 tensor could have some sparsity worth exploiting.
-
-        # matrix.dot(tensor) is not what we want, so we reverse the order of the
-        # product. Exploit symmetry of hgyy to only perform one transpose.
-        term3 = hgyy.dot(dydx).transpose((0, 2, 1)).dot(dydx)
-
-        rhs = term1 + term2 + term3
+        rhs = _hessians_along_dydx(hgxx, hgxy, hgyy, dydx)
 
         rhs.shape = (ny, nx*nx)
-        sol = jgy_fact.solve(rhs)
-        sol.shape = (ny, nx, nx)
-        d2ydx2 = -sol
+        d2ydx2 = jgy_fact.solve(rhs)
+        np.negative(d2ydx2, out=d2ydx2)
+        d2ydx2.shape = (ny, nx, nx)
 
         return d2ydx2
 
@@ -529,38 +832,33 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         x = self.input_vars
         y = self.external_vars
         f = self.residual_cons
-        g = self.external_cons
-        jfx = nlp.extract_submatrix_jacobian(x, f)
         jfy = nlp.extract_submatrix_jacobian(y, f)
 
-        dydx = self.evaluate_jacobian_external_variables()
+        # Factorize jgy once for both dydx and d2ydx2
+        jgy_fact, dydx = self._factorize_jgy_and_evaluate_dydx()
 
         ny = len(y)
         nf = len(f)
         nx = len(x)
 
-        hfxx = np.array([
-            get_hessian_of_constraint(con, x, nlp=nlp).toarray() for con in f
-            ])
-        hfxy = np.array([
-            get_hessian_of_constraint(con, x, y, nlp=nlp).toarray() for con in f
-            ])
-        hfyy = np.array([
-            get_hessian_of_constraint(con, y, nlp=nlp).toarray() for con in f
-            ])
-
-        d2ydx2 = self.evaluate_hessian_external_variables()
+        # Get Hessians of residual and external constraints in one pass
+        hxx, hxy, hyy = self._get_hessians_of_constraints(
+            self._constraint_indices
+        )
+        hfxx, hgxx = hxx[:nf], hxx[nf:]
+        hfxy, hgxy = hxy[:nf], hxy[nf:]
+        hfyy, hgyy = hyy[:nf], hyy[nf:]
 
-        term1 = hfxx
-        prod = hfxy.dot(dydx)
-        term2 = prod + prod.transpose((0, 2, 1))
-        term3 = hfyy.dot(dydx).transpose((0, 2, 1)).dot(dydx)
+        d2ydx2 = self._evaluate_hessian_external_variables(
+            jgy_fact, dydx, hgxx, hgxy, hgyy
+        )
 
         d2ydx2.shape = (ny, nx*nx)
         term4 = jfy.dot(d2ydx2)
         term4.shape = (nf, nx, nx)
 
-        d2fdx2 = term1 + term2 + term3 + term4
+        d2fdx2 = _hessians_along_dydx(hfxx, hfxy, hfyy, dydx)
+        d2fdx2 += term4
         return d2fdx2
 
     def evaluate_hessian_equality_constraints(self):
@@ -584,8 +882,8 @@ class ExternalPyomoModel(ExternalGreyBoxModel):
         # These terms can be used to calculate the corresponding
         # Hessian-of-Lagrangian term in the full space.
         hess_lag = self.calculate_reduced_hessian_lagrangian(hlxx, hlxy, hlyy)
-        sparse = _dense_to_full_sparse(hess_lag)
-        return sps.tril(sparse)
+        # This Hessian is symmetric, so we only need its lower triangle
+        return _dense_to_lower_triangular_sparse(hess_lag)
 
     def set_equality_constraint_scaling_factors(self, scaling_factors):
         """
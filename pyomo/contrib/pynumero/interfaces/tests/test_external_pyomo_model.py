@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 import itertools
+from unittest.mock import patch
 import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
@@ -30,9 +31,13 @@ if not AmplInterface.available():
 from pyomo.contrib.pynumero.algorithms.solvers.cyipopt_solver import (
     cyipopt_available,
 )
+from pyomo.contrib.pynumero.interfaces import external_pyomo_model
 from pyomo.contrib.pynumero.interfaces.external_pyomo_model import (
     ExternalPyomoModel,
     get_hessian_of_constraint,
+    _DenseLUFactor,
+    _factorize,
+    _hessians_along_dydx,
 )
 from pyomo.contrib.pynumero.interfaces.pyomo_grey_box_nlp import (
     PyomoNLPWithGreyBoxBlocks,
@@ -452,6 +457,22 @@ class TestGetHessianOfConstraint(unittest.TestCase):
         hess = get_hessian_of_constraint(m.eqn, variables).toarray()
         np.testing.assert_allclose(hess, expected_hess, rtol=1e-8)
 
+    def test_unused_variable_rectangular(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=1.0)
+        m.y = pyo.Var(initialize=1.0)
+        m.z = pyo.Var(initialize=1.0)
+        m.eqn = pyo.Constraint(expr=m.x**2 + m.x*m.y == 1.0)
+        expected_hess = np.array([[0, 1], [0, 0], [0, 2]])
+        hess = get_hessian_of_constraint(
+            m.eqn, [m.y, m.z, m.x], [m.z, m.x]
+        ).toarray()
+        np.testing.assert_allclose(hess, expected_hess, rtol=1e-8)
+
+        expected_hess = np.zeros((1, 2))
+        hess = get_hessian_of_constraint(m.eqn, [m.z], [m.x, m.y]).toarray()
+        np.testing.assert_allclose(hess, expected_hess, rtol=1e-8)
+
     def test_explicit_zeros(self):
         m = pyo.ConcreteModel()
         m.x = pyo.Var(initialize=1.0)
@@ -746,6 +767,70 @@ class TestExternalPyomoModel(unittest.TestCase):
             for matrix1, matrix2 in zip(hess, expected_hess):
                 np.testing.assert_allclose(matrix1, matrix2, rtol=1e-8)
 
+    def test_external_derivatives_reuse_factorization_SimpleModel2x2_1(self):
+        # Evaluate derivatives several times at each point, interleaved
+        # with new inputs, to make sure the cached factorization of jgy
+        # is reused at a point and discarded when the inputs change.
+        model = SimpleModel2by2_1()
+        m = model.make_model()
+        m.x[0].set_value(1.0)
+        m.x[1].set_value(2.0)
+        m.y[0].set_value(3.0)
+        m.y[1].set_value(4.0)
+        x0_init_list = [-5.0, -3.0, 0.5, 1.0, 2.5]
+        x1_init_list = [-4.5, -2.3, 0.0, 1.0, 4.1]
+        x_init_list = list(itertools.product(x0_init_list, x1_init_list))
+        external_model = ExternalPyomoModel(
+                list(m.x.values()),
+                list(m.y.values()),
+                list(m.residual_eqn.values()),
+                list(m.external_eqn.values()),
+                )
+
+        for x in x_init_list:
+            external_model.set_input_values(x)
+            expected_jac = model.evaluate_external_jacobian(x)
+            expected_hess = model.evaluate_external_hessian(x)
+            for _ in range(2):
+                jac = external_model.evaluate_jacobian_external_variables()
+                np.testing.assert_allclose(jac, expected_jac, rtol=1e-8)
+                hess = external_model.evaluate_hessian_external_variables()
+                for matrix1, matrix2 in zip(hess, expected_hess):
+                    np.testing.assert_allclose(matrix1, matrix2, rtol=1e-8)
+
+    def test_set_input_values_coupled_external_eqns(self):
+        # The external equations form a single 2x2 strongly connected
+        # component, so they cannot be solved one variable at a time.
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(initialize=1.0)
+        m.y = pyo.Var([0, 1], initialize=1.0)
+        m.external_eqn_0 = pyo.Constraint(expr=m.y[0]**2 + m.y[1] == m.x + 2)
+        m.external_eqn_1 = pyo.Constraint(expr=m.y[0] - m.y[1]**3 == m.x)
+        m.residual_eqn = pyo.Constraint(expr=m.y[0]*m.y[1] + m.x == 1)
+
+        class _NoSolver(object):
+            # Newton's method should solve the component without
+            # falling back to a solver.
+            def solve(self, *args, **kwds):
+                raise AssertionError("Solver should not be called")
+
+        external_model = ExternalPyomoModel(
+                [m.x],
+                [m.y[0], m.y[1]],
+                [m.residual_eqn],
+                [m.external_eqn_0, m.external_eqn_1],
+                use_cyipopt=False,
+                solver=_NoSolver(),
+                )
+
+        for x in [1.0, 1.2, 1.5, 3.0]:
+            external_model.set_input_values([x])
+            external_model.evaluate_jacobian_external_variables()
+            y0 = m.y[0].value
+            y1 = m.y[1].value
+            self.assertAlmostEqual(y0**2 + y1, x + 2, delta=1e-7)
+            self.assertAlmostEqual(y0 - y1**3, x, delta=1e-7)
+
     def test_evaluate_SimpleModel2x2_1(self):
         model = SimpleModel2by2_1()
         m = model.make_model()
@@ -1044,6 +1129,97 @@ class TestUpdatedHessianCalculationMethods(unittest.TestCase):
             )
 
 
+class TestFactorize(unittest.TestCase):
+
+    def _force_sparse_lu(self):
+        # Make every matrix too large and too sparse for the dense path
+        return (
+            patch.object(external_pyomo_model, "_DENSE_LU_MAX_DIM", 0),
+            patch.object(external_pyomo_model, "_DENSE_LU_MIN_DENSITY", 2.0),
+        )
+
+    def _make_matrix(self):
+        return np.array([
+            [4.0, 1.0, 0.0, 0.0],
+            [0.0, 3.0, 2.0, 0.0],
+            [1.0, 0.0, 5.0, 0.0],
+            [0.0, 0.0, 1.0, 2.0],
+        ])
+
+    def _check_solve(self, factor, dense):
+        rhs = np.array([1.0, -2.0, 3.0, 0.5])
+        for trans, matrix in [("N", dense), ("T", dense.transpose())]:
+            np.testing.assert_allclose(
+                factor.solve(rhs.copy(), trans=trans),
+                np.linalg.solve(matrix, rhs),
+                rtol=1e-10,
+                atol=1e-14,
+            )
+
+    def test_dense_lu(self):
+        dense = self._make_matrix()
+        factor = _factorize(sps.coo_matrix(dense))
+        self.assertIsInstance(factor, _DenseLUFactor)
+        self._check_solve(factor, dense)
+
+    def test_sparse_lu(self):
+        dense = self._make_matrix()
+        max_dim_patch, density_patch = self._force_sparse_lu()
+        with max_dim_patch, density_patch:
+            factor = _factorize(sps.coo_matrix(dense))
+        self.assertNotIsInstance(factor, _DenseLUFactor)
+        self._check_solve(factor, dense)
+
+    def test_singular_matrix(self):
+        # Both factorizations raise the same error for a singular matrix
+        singular = sps.coo_matrix(np.array([
+            [1.0, 2.0],
+            [2.0, 4.0],
+        ]))
+        with self.assertRaisesRegex(RuntimeError, "exactly singular"):
+            _factorize(singular)
+        max_dim_patch, density_patch = self._force_sparse_lu()
+        with max_dim_patch, density_patch:
+            with self.assertRaisesRegex(RuntimeError, "exactly singular"):
+                _factorize(singular)
+
+
+class TestHessiansAlongDydx(unittest.TestCase):
+
+    def _reference(self, hxx, hxy, hyy, dydx):
+        # One constraint at a time, with plain matrix products
+        n = hxx.shape[0]
+        out = np.empty(hxx.shape)
+        for i in range(n):
+            prod = hxy[i].dot(dydx)
+            out[i] = (
+                hxx[i] + prod + prod.transpose()
+                + dydx.transpose().dot(hyy[i]).dot(dydx)
+            )
+        return out
+
+    def test_against_reference(self):
+        rng = np.random.default_rng(1234)
+        # (number of constraints, number of x, number of y)
+        shapes = [(1, 1, 1), (3, 2, 5), (4, 7, 3), (60, 20, 60), (20, 60, 20)]
+        for n, nx, ny in shapes:
+            hxx = rng.standard_normal((n, nx, nx))
+            hxx += hxx.transpose((0, 2, 1))
+            hxy = rng.standard_normal((n, nx, ny))
+            hyy = rng.standard_normal((n, ny, ny))
+            hyy += hyy.transpose((0, 2, 1))
+            dydx = rng.standard_normal((ny, nx))
+            inputs = (hxx, hxy, hyy, dydx)
+            input_copies = [array.copy() for array in inputs]
+            expected = self._reference(hxx, hxy, hyy, dydx)
+            actual = _hessians_along_dydx(hxx, hxy, hyy, dydx)
+            self.assertEqual(actual.shape, (n, nx, nx))
+            np.testing.assert_allclose(actual, expected, rtol=1e-10, atol=1e-10)
+            # The terms are accumulated in place, but not into the inputs
+            for array, copy in zip(inputs, input_copies):
+                np.testing.assert_array_equal(array, copy)
+
+
 class TestScaling(unittest.TestCase):
 
     def con_3_body(self, x, y, u, v):